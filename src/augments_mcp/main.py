@@ -11,7 +11,7 @@ import sys
 
 def main():
     """Main entry point for the server."""
-    # Import after warnings are configured
+    # Deferred import: server.py forces wsproto itself, so no warning filters are needed
     from .server import main as server_main
     
     # Run the server with any command line arguments
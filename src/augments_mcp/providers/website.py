@@ -28,6 +28,7 @@ class WebsiteProvider(BaseProvider):
                     'User-Agent': 'Augments-MCP-Server/1.0 (Documentation Fetcher)'
                 },
                 follow_redirects=True,
+                http2=True,  # Multiplex concurrent page fetches per host
                 limits=httpx.Limits(
                     max_keepalive_connections=5,
                     max_connections=10,
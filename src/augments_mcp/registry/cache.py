@@ -114,6 +114,24 @@ class DocumentationCache:
         logger.debug("Cache miss", framework=framework, path=path)
         return None
     
+    async def get_many(
+        self,
+        framework: str,
+        paths: List[str],
+        source_type: str = "docs"
+    ) -> Dict[str, str]:
+        """Get cached content for several paths of one framework.
+        
+        Returns:
+            Mapping of path to cached content for every path that was a hit
+        """
+        results: Dict[str, str] = {}
+        for path in paths:
+            content = await self.get(framework, path, source_type)
+            if content is not None:
+                results[path] = content
+        return results
+    
     async def set(
         self,
         framework: str,
@@ -47,6 +47,11 @@ class FrameworkRegistryManager:
         self.frameworks: Dict[str, FrameworkConfig] = {}
         self._observer: Optional[Observer] = None
         self._loaded = False
+        # Bumped on every config change so callers can invalidate derived caches
+        self.revision = 0
+        # Sorted listings per category, valid for _list_cache_revision only
+        self._list_cache: Dict[Optional[str], List[FrameworkInfo]] = {}
+        self._list_cache_revision = -1
     
     async def initialize(self) -> None:
         """Initialize the registry and start file watching."""
@@ -88,6 +93,7 @@ class FrameworkRegistryManager:
     async def load_all_frameworks(self) -> None:
         """Load all framework configurations from the frameworks directory."""
         self.frameworks.clear()
+        self.revision += 1
         
         if not self.frameworks_dir.exists():
             logger.warning("Frameworks directory not found", dir=str(self.frameworks_dir))
@@ -113,6 +119,7 @@ class FrameworkRegistryManager:
             
             config = FrameworkConfig(**data)
             self.frameworks[config.name] = config
+            self.revision += 1
             
             logger.info("Loaded framework configuration", 
                        framework=config.name, 
@@ -137,6 +144,14 @@ class FrameworkRegistryManager:
     
     def list_frameworks(self, category: Optional[str] = None) -> List[FrameworkInfo]:
         """List all frameworks, optionally filtered by category."""
+        if self._list_cache_revision != self.revision:
+            self._list_cache.clear()
+            self._list_cache_revision = self.revision
+        
+        cached = self._list_cache.get(category)
+        if cached is not None:
+            return list(cached)
+        
         frameworks = []
         
         for config in self.frameworks.values():
@@ -157,7 +172,11 @@ class FrameworkRegistryManager:
         
         # Sort by priority (higher first) then by name
         frameworks.sort(key=lambda x: (-x.priority, x.name))
-        return frameworks
+        
+        # Only memoize known categories so arbitrary filters can't grow the cache
+        if frameworks or category is None:
+            self._list_cache[category] = frameworks
+        return list(frameworks)
     
     def search_frameworks(self, query: str) -> List[SearchResult]:
         """Search frameworks by name, features, or patterns."""
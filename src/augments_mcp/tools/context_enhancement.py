@@ -1,6 +1,9 @@
 """Context enhancement tools for multi-framework development."""
 
+import asyncio
 import re
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Any, Optional
 import structlog
 from mcp.server.fastmcp import Context
@@ -90,10 +93,12 @@ async def get_framework_context(
             
             # Get documentation snippets for relevant sections
             doc_snippets = []
-            for section in relevant_sections[:3]:  # Limit to top 3 sections
+            top_sections = relevant_sections[:3]  # Limit to top 3 sections
+            cached_sections = await cache.get_many(framework, top_sections, "docs")
+            
+            for section in top_sections:
                 try:
-                    # First try to get from cache
-                    cached_content = await cache.get(framework, section, "docs")
+                    cached_content = cached_sections.get(section)
                     if cached_content:
                         snippet = _extract_relevant_snippet(cached_content, task_keywords, section)
                         if snippet:
@@ -148,7 +153,8 @@ async def analyze_code_compatibility(
     registry: FrameworkRegistryManager,
     code: str,
     frameworks: List[str],
-    ctx: Optional[Context] = None
+    ctx: Optional[Context] = None,
+    executor: Optional[Executor] = None
 ) -> Dict[str, Any]:
     """Analyze code for framework compatibility and suggest improvements.
     
@@ -157,6 +163,10 @@ async def analyze_code_compatibility(
         code: Code snippet to analyze
         frameworks: List of frameworks the code should work with
         ctx: MCP context for progress reporting
+        executor: Optional executor for the CPU-bound analysis, keeping it off
+            the event loop (e.g. a process pool in the web server). If a worker
+            dies, BrokenProcessPool is raised unwrapped so the caller can
+            replace the pool.
         
     Returns:
         Analysis results with compatibility issues and improvement suggestions
@@ -172,88 +182,49 @@ async def analyze_code_compatibility(
             raise ToolError("No frameworks specified for compatibility check")
         
         # Validate frameworks
-        valid_frameworks = []
         framework_configs = {}
         
         for framework in frameworks:
             config = registry.get_framework(framework)
             if config:
-                valid_frameworks.append(framework)
                 framework_configs[framework] = config
             else:
                 logger.warning("Framework not found for analysis", framework=framework)
         
-        if not valid_frameworks:
+        if not framework_configs:
             raise ToolError("No valid frameworks found")
         
         if ctx:
             await ctx.report_progress(0.2, 1.0, "Analyzing code structure")
-        
-        # Analyze code structure
-        code_analysis = _analyze_code_structure(code)
-        
-        # Check compatibility with each framework
-        issues = []
-        suggestions = []
-        compatibility_scores = {}
-        
-        for framework in valid_frameworks:
-            if ctx:
+            for framework in framework_configs:
                 await ctx.debug(f"Checking compatibility with {framework}")
-            
-            config = framework_configs[framework]
-            framework_issues, framework_suggestions, score = await _check_framework_compatibility(
-                code, code_analysis, config
+        
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                executor, analyze_code_compatibility_sync, code, framework_configs
             )
-            
-            issues.extend(framework_issues)
-            suggestions.extend(framework_suggestions)
-            compatibility_scores[framework] = score
+        else:
+            result = analyze_code_compatibility_sync(code, framework_configs)
         
         if ctx:
             await ctx.report_progress(0.8, 1.0, "Generating recommendations")
         
-        # Calculate overall compatibility
-        overall_score = sum(compatibility_scores.values()) / len(compatibility_scores)
-        is_compatible = overall_score >= 0.7 and len([i for i in issues if i.severity == "error"]) == 0
-        
-        # Generate cross-framework suggestions
-        cross_framework_suggestions = _generate_cross_framework_suggestions(
-            valid_frameworks, framework_configs, code_analysis
-        )
-        suggestions.extend(cross_framework_suggestions)
-        
-        # Remove duplicate suggestions
-        unique_suggestions = list(set(suggestions))
-        
-        result = {
-            "compatible": is_compatible,
-            "frameworks": valid_frameworks,
-            "overall_compatibility_score": round(overall_score, 2),
-            "framework_scores": {k: round(v, 2) for k, v in compatibility_scores.items()},
-            "issues": [
-                {
-                    "line": issue.line,
-                    "severity": issue.severity,
-                    "message": issue.message,
-                    "suggestion": issue.suggestion
-                }
-                for issue in issues
-            ],
-            "suggestions": unique_suggestions,
-            "code_analysis": code_analysis
-        }
+        overall_score = result["overall_compatibility_score"]
         
         if ctx:
             await ctx.info(f"Compatibility analysis completed - Score: {overall_score:.2f}")
         
         logger.info("Code compatibility analysis completed", 
-                   frameworks=valid_frameworks,
+                   frameworks=result["frameworks"],
                    overall_score=overall_score,
-                   issues=len(issues))
+                   issues=len(result["issues"]))
         
         return result
         
+    except BrokenProcessPool:
+        # A worker died; the executor is unusable and its owner has to replace it
+        raise
     except Exception as e:
         error_msg = f"Code compatibility analysis failed: {str(e)}"
         logger.error("Compatibility analysis failed", 
@@ -264,6 +235,73 @@ async def analyze_code_compatibility(
         raise ToolError(error_msg)
 
 
+def analyze_code_compatibility_sync(
+    code: str,
+    framework_configs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run the CPU-bound part of analyze_code_compatibility.
+    
+    Works on already resolved framework configs instead of the registry, so it
+    can be shipped to a worker process.
+    
+    Args:
+        code: Code snippet to analyze
+        framework_configs: Mapping of framework name to its configuration
+        
+    Returns:
+        Analysis results with compatibility issues and improvement suggestions
+    """
+    valid_frameworks = list(framework_configs)
+    
+    # Analyze code structure
+    code_analysis = _analyze_code_structure(code)
+    
+    # Check compatibility with each framework
+    issues = []
+    suggestions = []
+    compatibility_scores = {}
+    
+    for framework in valid_frameworks:
+        framework_issues, framework_suggestions, score = _check_framework_compatibility(
+            code, code_analysis, framework_configs[framework]
+        )
+        
+        issues.extend(framework_issues)
+        suggestions.extend(framework_suggestions)
+        compatibility_scores[framework] = score
+    
+    # Calculate overall compatibility
+    overall_score = sum(compatibility_scores.values()) / len(compatibility_scores)
+    is_compatible = overall_score >= 0.7 and len([i for i in issues if i.severity == "error"]) == 0
+    
+    # Generate cross-framework suggestions
+    cross_framework_suggestions = _generate_cross_framework_suggestions(
+        valid_frameworks, framework_configs, code_analysis
+    )
+    suggestions.extend(cross_framework_suggestions)
+    
+    # Remove duplicate suggestions
+    unique_suggestions = list(set(suggestions))
+    
+    return {
+        "compatible": is_compatible,
+        "frameworks": valid_frameworks,
+        "overall_compatibility_score": round(overall_score, 2),
+        "framework_scores": {k: round(v, 2) for k, v in compatibility_scores.items()},
+        "issues": [
+            {
+                "line": issue.line,
+                "severity": issue.severity,
+                "message": issue.message,
+                "suggestion": issue.suggestion
+            }
+            for issue in issues
+        ],
+        "suggestions": unique_suggestions,
+        "code_analysis": code_analysis
+    }
+
+
 def _extract_task_keywords(task_description: str) -> List[str]:
     """Extract relevant keywords from task description."""
     # Common development keywords and patterns
@@ -689,7 +727,7 @@ def _detect_patterns(code: str) -> List[str]:
     return patterns
 
 
-async def _check_framework_compatibility(
+def _check_framework_compatibility(
     code: str, 
     code_analysis: Dict[str, Any], 
     config
@@ -702,20 +740,9 @@ async def _check_framework_compatibility(
     framework_name = config.name.lower()
     
     # Framework-specific compatibility checks
-    if framework_name == 'react':
-        issues_found, suggestions_made, score_penalty = _check_react_compatibility(code, code_analysis)
-        issues.extend(issues_found)
-        suggestions.extend(suggestions_made)
-        score -= score_penalty
-    
-    elif framework_name == 'nextjs':
-        issues_found, suggestions_made, score_penalty = _check_nextjs_compatibility(code, code_analysis)
-        issues.extend(issues_found)
-        suggestions.extend(suggestions_made)
-        score -= score_penalty
-    
-    elif framework_name == 'tailwindcss':
-        issues_found, suggestions_made, score_penalty = _check_tailwind_compatibility(code, code_analysis)
+    checker = _COMPATIBILITY_CHECKERS.get(framework_name)
+    if checker:
+        issues_found, suggestions_made, score_penalty = checker(code, code_analysis)
         issues.extend(issues_found)
         suggestions.extend(suggestions_made)
         score -= score_penalty
@@ -797,6 +824,14 @@ def _check_tailwind_compatibility(code: str, analysis: Dict[str, Any]) -> tuple[
     return issues, suggestions, score_penalty
 
 
+# Framework name -> compatibility checker, looked up once per framework
+_COMPATIBILITY_CHECKERS = {
+    'react': _check_react_compatibility,
+    'nextjs': _check_nextjs_compatibility,
+    'tailwindcss': _check_tailwind_compatibility,
+}
+
+
 def _is_tailwind_class(class_name: str) -> bool:
     """Check if a class name follows Tailwind CSS patterns."""
     tailwind_patterns = [
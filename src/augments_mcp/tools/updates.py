@@ -1,5 +1,6 @@
 """Framework update checking and cache refresh tools."""
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import structlog
@@ -14,6 +15,9 @@ from ..utils.github_client import GitHubClient
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of frameworks refreshed at the same time
+REFRESH_CONCURRENCY = 8
+
 
 async def check_framework_updates(
     registry: FrameworkRegistryManager,
@@ -165,26 +169,39 @@ async def refresh_framework_cache(
             if ctx:
                 await ctx.info(f"Refreshing cache for all {len(frameworks_to_refresh)} frameworks")
         
-        refresh_results = []
         failed_refreshes = []
+        completed = 0
+        # Bound concurrent refreshes to stay within provider rate limits
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
         
-        for i, fw_name in enumerate(frameworks_to_refresh):
+        async def refresh_one(fw_name: str) -> Optional[Dict[str, Any]]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await _refresh_single_framework(
+                        registry, cache, github_provider, website_provider,
+                        fw_name, force
+                    )
+                except Exception as e:
+                    logger.error("Failed to refresh framework cache", 
+                               framework=fw_name, 
+                               error=str(e))
+                    failed_refreshes.append(fw_name)
+                    result = None
+            
+            completed += 1
             if ctx:
-                progress = (i + 1) / len(frameworks_to_refresh)
-                await ctx.report_progress(progress * 0.9, 1.0, f"Refreshing {fw_name}")
+                # Progress is best effort; a failed report must not abort the other refreshes
+                try:
+                    progress = completed / len(frameworks_to_refresh)
+                    await ctx.report_progress(progress * 0.9, 1.0, f"Refreshed {fw_name}")
+                except Exception as e:
+                    logger.warning("Failed to report refresh progress", error=str(e))
             
-            try:
-                result = await _refresh_single_framework(
-                    registry, cache, github_provider, website_provider,
-                    fw_name, force
-                )
-                refresh_results.append(result)
-                
-            except Exception as e:
-                logger.error("Failed to refresh framework cache", 
-                           framework=fw_name, 
-                           error=str(e))
-                failed_refreshes.append(fw_name)
+            return result
+        
+        results = await asyncio.gather(*[refresh_one(fw_name) for fw_name in frameworks_to_refresh])
+        refresh_results = [r for r in results if r is not None]
         
         # Generate summary
         total_refreshed = len([r for r in refresh_results if r.get("refreshed", False)])
@@ -48,6 +48,7 @@ class GitHubClient:
         self.client = httpx.AsyncClient(
             headers=headers,
             timeout=30.0,
+            http2=True,  # Multiplex concurrent API requests over one connection
             limits=httpx.Limits(
                 max_keepalive_connections=5,
                 max_connections=10,
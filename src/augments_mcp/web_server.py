@@ -4,25 +4,29 @@ Production-ready web server with rate limiting, authentication, and monitoring
 """
 
 import os
-import asyncio
 import time
+import multiprocessing
 import hashlib
 import secrets
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Type
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+import orjson
 import redis.asyncio as redis
 import structlog
 from fastapi import FastAPI, HTTPException, Request, Depends, Header, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from prometheus_client import Counter, Histogram, generate_latest
-from pydantic import BaseModel, Field
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
 from .registry.manager import FrameworkRegistryManager
@@ -41,6 +45,8 @@ from .middleware.abuse_detector import AbuseDetector
 
 # Configure logging
 logger = structlog.get_logger(__name__)
+# Tracebacks and error details are only rendered in debug mode
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 
 # Metrics
 REQUEST_COUNT = Counter('api_requests_total', 'Total API requests', ['method', 'endpoint', 'status'])
@@ -76,6 +82,57 @@ class CodeAnalysisRequest(BaseModel):
     code: str = Field(..., description="Code to analyze")
     frameworks: List[str] = Field(..., description="Frameworks to check")
 
+def json_body(model: Type[BaseModel]):
+    """Dependency that validates the raw request body straight into a model.
+    
+    Pydantic parses the JSON bytes in one pass instead of json.loads followed
+    by validating the intermediate dict, which matters for large payloads.
+    Bodies over MAX_REQUEST_BODY_BYTES are rejected with 413 while streaming,
+    including chunked bodies without a Content-Length.
+    """
+    async def parse_body(request: Request) -> BaseModel:
+        too_large = HTTPException(
+            status_code=413,  # Numeric: the status constant was renamed in Starlette 0.48
+            detail=f"Request body exceeds limit ({MAX_REQUEST_BODY_BYTES} bytes)"
+        )
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+            raise too_large
+        
+        chunks = []
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > MAX_REQUEST_BODY_BYTES:
+                raise too_large
+            chunks.append(chunk)
+        
+        try:
+            return model.model_validate_json(b"".join(chunks))
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+    
+    return parse_body
+
+def json_body_docs(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body description for endpoints using json_body.
+    
+    The schema is inlined rather than registered under components, so only
+    flat models are supported: nested models would emit "$defs" references
+    that do not resolve inside the OpenAPI document.
+    """
+    schema = model.model_json_schema()
+    if "$defs" in schema:
+        raise ValueError(f"json_body_docs only supports flat models, {model.__name__} has nested models")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
+
 # Global instances
 app: Optional[FastAPI] = None
 redis_client: Optional[redis.Redis] = None
@@ -83,21 +140,35 @@ registry_manager: Optional[FrameworkRegistryManager] = None
 doc_cache: Optional[DocumentationCache] = None
 github_provider: Optional[GitHubProvider] = None
 website_provider: Optional[WebsiteProvider] = None
+cpu_pool: Optional[ProcessPoolExecutor] = None
 
 # Global middleware components
 smart_limiter: Optional[SmartRateLimiter] = None
 abuse_detector: Optional[AbuseDetector] = None
 request_coalescer: Optional['RequestCoalescer'] = None
 
-# Rate limiting
-def get_redis_url():
-    """Get Redis URL from environment or default"""
-    return os.getenv("REDIS_URL", "redis://localhost:6379")
+# Environment configuration, read once at import
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "20"))
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8080"))
+# Worker processes for CPU-bound code analysis
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "2"))
+# Largest JSON body accepted by json_body endpoints
+MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES", str(128 * 1024)))
+# Comma-separated; set ALLOWED_ORIGINS="" to drop CORS handling entirely
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "https://mcp.augments.dev,https://augments.dev").split(",")
+    if origin.strip()
+]
 
+# Rate limiting
 # Create rate limiter with Redis backend for distributed rate limiting
 limiter = Limiter(
     key_func=get_remote_address,
-    storage_uri=get_redis_url(),
+    storage_uri=REDIS_URL,
     default_limits=["100 per minute", "1000 per hour"]
 )
 
@@ -127,22 +198,27 @@ async def verify_api_key(x_api_key: str = Header(..., alias="X-API-Key")):
         detail="Invalid API key"
     )
 
+# Tier descriptors returned by get_api_tier, shared across requests (read-only)
+_PUBLIC_TIER = {"tier": "public", "rate_limit_multiplier": 1}
+_PREMIUM_TIER = {"tier": "premium", "rate_limit_multiplier": 10}
+_DEMO_TIER = {"tier": "demo", "rate_limit_multiplier": 3}
+
 async def get_api_tier(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -> dict:
     """Get API tier for request - allows public access"""
     # No API key = public tier
     if not x_api_key:
-        return {"tier": "public", "rate_limit_multiplier": 1}
+        return _PUBLIC_TIER
     
     # Master API key = premium tier
     if MASTER_API_KEY and x_api_key == MASTER_API_KEY:
-        return {"tier": "premium", "rate_limit_multiplier": 10}
+        return _PREMIUM_TIER
     
     # Demo keys = demo tier
     if x_api_key.startswith("demo_"):
-        return {"tier": "demo", "rate_limit_multiplier": 3}
+        return _DEMO_TIER
     
     # Invalid API key still gets public access (frictionless)
-    return {"tier": "public", "rate_limit_multiplier": 1}
+    return _PUBLIC_TIER
 
 # Request ID middleware
 async def add_request_id(request: Request, call_next):
@@ -167,39 +243,55 @@ async def add_request_id(request: Request, call_next):
     
     return response
 
+# Analysis process pool
+def create_cpu_pool() -> ProcessPoolExecutor:
+    """Process pool for CPU-bound code analysis; spawn avoids forking a threaded server"""
+    return ProcessPoolExecutor(
+        max_workers=ANALYSIS_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+def replace_broken_cpu_pool(app: FastAPI, broken: ProcessPoolExecutor):
+    """Swap in a fresh pool after a worker died, unless another request already did"""
+    global cpu_pool
+    
+    if app.state.cpu_pool is not broken:
+        return
+    
+    logger.warning("Analysis process pool broken, replacing it")
+    broken.shutdown(wait=False, cancel_futures=True)
+    cpu_pool = create_cpu_pool()
+    app.state.cpu_pool = cpu_pool
+
 # Lifespan manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle"""
-    global redis_client, registry_manager, doc_cache, github_provider, website_provider
+    global redis_client, registry_manager, doc_cache, github_provider, website_provider, cpu_pool
     global smart_limiter, abuse_detector, request_coalescer
     
     logger.info("Starting Augments Web API Server")
     
     try:
-        # Initialize Redis with retry logic
-        redis_url = get_redis_url()
-        logger.info(f"Connecting to Redis at: {redis_url}")
-        
-        for attempt in range(10):  # Try 10 times
-            try:
-                redis_client = await redis.from_url(
-                    redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_timeout=30,  # Increased from 5s to prevent premature timeouts
-                    socket_connect_timeout=10,  # Increased from 5s
-                    socket_keepalive=True,  # Enable TCP keepalive
-                    retry_on_timeout=True  # Retry on timeout
-                )
-                await redis_client.ping()
-                logger.info("Connected to Redis successfully")
-                break
-            except Exception as e:
-                logger.warning(f"Redis connection attempt {attempt + 1}/10 failed: {e}")
-                if attempt == 9:  # Last attempt
-                    raise
-                await asyncio.sleep(2)  # Wait 2 seconds before retry
+        # Redis connects lazily: the pool opens a connection on the first command,
+        # so startup never blocks on Redis and callers degrade per request
+        logger.info(f"Using Redis at: {REDIS_URL}")
+        
+        # Shared connection pool; the client owns it and closes it on shutdown.
+        # Blocking so bursts beyond the pool size queue instead of failing
+        redis_pool = redis.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_POOL_SIZE,
+            timeout=10,  # Max wait for a free connection
+            health_check_interval=30,  # Ping idle connections before reuse
+            encoding="utf-8",
+            decode_responses=True,
+            socket_timeout=30,  # Increased from 5s to prevent premature timeouts
+            socket_connect_timeout=10,  # Increased from 5s
+            socket_keepalive=True,  # Enable TCP keepalive
+            retry_on_timeout=True  # Retry on timeout
+        )
+        redis_client = redis.Redis.from_pool(redis_pool)
         
         # Initialize components with safe cache directory
         cache_dir = os.getenv("AUGMENTS_CACHE_DIR", "/app/cache")
@@ -220,10 +312,11 @@ async def lifespan(app: FastAPI):
         
         doc_cache = DocumentationCache(cache_dir=cache_dir)
         
-        github_token = os.getenv("GITHUB_TOKEN")
-        github_provider = GitHubProvider(github_token)
+        github_provider = GitHubProvider(GITHUB_TOKEN)
         website_provider = WebsiteProvider()
         
+        cpu_pool = create_cpu_pool()
+        
         # Initialize middleware components (non-ASGI ones only)
         smart_limiter = SmartRateLimiter(redis_client)
         abuse_detector = AbuseDetector(redis_client)
@@ -235,6 +328,7 @@ async def lifespan(app: FastAPI):
         app.state.doc_cache = doc_cache
         app.state.github_provider = github_provider
         app.state.website_provider = website_provider
+        app.state.cpu_pool = cpu_pool
         
         logger.info("All components initialized successfully - v2")
         
@@ -267,6 +361,10 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning("Error closing website provider", error=str(e))
 
+        if cpu_pool:
+            cpu_pool.shutdown(wait=False, cancel_futures=True)
+            logger.info("Analysis process pool shut down")
+
         # Close Redis connection
         if redis_client:
             try:
@@ -286,13 +384,14 @@ app = FastAPI(
 )
 
 # Add middlewares
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["https://mcp.augments.dev", "https://augments.dev"],
-    allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
+if ALLOWED_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_credentials=False,  # Auth uses the X-API-Key header, not cookies
+        allow_methods=["GET", "POST"],
+        allow_headers=["Content-Type", API_KEY_HEADER],
+    )
 
 app.add_middleware(
     TrustedHostMiddleware,
@@ -306,15 +405,24 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # Health check endpoints
+# Probes hit these constantly, so their bodies are pre-encoded
+_ROOT_BODY = orjson.dumps({"message": "Augments MCP Server is running"})
+
 @app.get("/")
 async def root():
     """Root endpoint - simplest possible check"""
-    return {"message": "Augments MCP Server is running"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Basic health check - always responds if server is running"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat(), "server": "augments-mcp"}
+    return Response(
+        content=(
+            b'{"status":"healthy","timestamp":"' + datetime.utcnow().isoformat().encode()
+            + b'","server":"augments-mcp"}'
+        ),
+        media_type="application/json"
+    )
 
 @app.get("/debug/state")
 async def debug_state(request: Request):
@@ -388,7 +496,8 @@ async def detailed_health(request: Request):
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
-    return generate_latest()
+    # Plain response: the exposition format is already bytes, skip the JSON encoder
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 # New monitoring endpoints
 @app.get("/api/v1/admin/protection-stats")
@@ -479,6 +588,24 @@ async def list_frameworks(
 ):
     """List available frameworks"""
     try:
+        if category is None:
+            # Unfiltered catalog is polled often and rarely changes; serve pre-encoded bytes
+            # Cached as (registry, revision, body) so a new registry never matches an old body
+            registry = request.app.state.registry_manager
+            catalog = getattr(request.app.state, "catalog_cache", None)
+            if catalog is None or catalog[0] is not registry or catalog[1] != registry.revision:
+                frameworks = await framework_discovery.list_available_frameworks(registry=registry)
+                catalog = (registry, registry.revision, orjson.dumps(frameworks))
+                request.app.state.catalog_cache = catalog
+            
+            return Response(
+                content=(
+                    b'{"success":true,"data":{"frameworks":' + catalog[2]
+                    + b'},"request_id":' + orjson.dumps(request.state.request_id) + b'}'
+                ),
+                media_type="application/json"
+            )
+        
         frameworks = await framework_discovery.list_available_frameworks(
             registry=request.app.state.registry_manager,
             category=category
@@ -508,17 +635,24 @@ async def get_framework_info(
             registry=request.app.state.registry_manager,
             framework_name=framework
         )
-        
-        return SuccessResponse(
-            data=info,
-            request_id=request.state.request_id
-        )
     except Exception as e:
         logger.error("Error getting framework info", framework=framework, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Framework '{framework}' not found"
         )
+    
+    # Unknown frameworks are a client error, not a lookup failure
+    if info is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Framework '{framework}' not found"
+        )
+    
+    return SuccessResponse(
+        data=info,
+        request_id=request.state.request_id
+    )
 
 @app.post("/api/v1/frameworks/search", response_model=SuccessResponse)
 async def search_frameworks(
@@ -640,10 +774,14 @@ async def get_framework_context(
             detail=str(e)
         )
 
-@app.post("/api/v1/analyze", response_model=SuccessResponse)
+@app.post(
+    "/api/v1/analyze",
+    response_model=SuccessResponse,
+    openapi_extra=json_body_docs(CodeAnalysisRequest)
+)
 async def analyze_code(
     request: Request,
-    analysis_req: CodeAnalysisRequest,
+    analysis_req: CodeAnalysisRequest = Depends(json_body(CodeAnalysisRequest)),
     api_tier: dict = Depends(get_api_tier)
 ):
     """Analyze code for framework compatibility"""
@@ -655,11 +793,22 @@ async def analyze_code(
                 detail="Code size exceeds limit (50KB)"
             )
         
-        analysis = await context_enhancement.analyze_code_compatibility(
-            registry=request.app.state.registry_manager,
-            code=analysis_req.code,
-            frameworks=analysis_req.frameworks
-        )
+        executor = request.app.state.cpu_pool
+        try:
+            analysis = await context_enhancement.analyze_code_compatibility(
+                registry=request.app.state.registry_manager,
+                code=analysis_req.code,
+                frameworks=analysis_req.frameworks,
+                executor=executor
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM killed); replace the pool and answer this request inline
+            replace_broken_cpu_pool(request.app, executor)
+            analysis = await context_enhancement.analyze_code_compatibility(
+                registry=request.app.state.registry_manager,
+                code=analysis_req.code,
+                frameworks=analysis_req.frameworks
+            )
         
         return SuccessResponse(
             data=analysis,
@@ -731,15 +880,20 @@ async def refresh_cache(
         )
 
 # Error handlers
+# Pre-encoded error envelopes; only the dynamic fields are serialized per error
+_HTTP_ERROR_BODY = b'{"error":%b,"request_id":%b}'
+_INTERNAL_ERROR_BODY = b'{"error":"Internal server error","detail":%b,"request_id":%b}'
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return Response(
+        content=_HTTP_ERROR_BODY % (
+            orjson.dumps(exc.detail),
+            orjson.dumps(getattr(request.state, "request_id", None))
+        ),
         status_code=exc.status_code,
-        content={
-            "error": exc.detail,
-            "request_id": getattr(request.state, "request_id", None)
-        }
+        media_type="application/json"
     )
 
 @app.exception_handler(Exception)
@@ -747,21 +901,20 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error("Unhandled exception", error=str(exc), exc_info=True)
     
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY % (
+            orjson.dumps(str(exc) if DEBUG else None),
+            orjson.dumps(getattr(request.state, "request_id", None))
+        ),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal server error",
-            "detail": str(exc) if os.getenv("DEBUG") else None,
-            "request_id": getattr(request.state, "request_id", None)
-        }
+        media_type="application/json"
     )
 
 # Main entry point
 def main():
     """Run the web server"""
-    port = int(os.getenv("PORT", "8080"))
-    host = os.getenv("HOST", "0.0.0.0")
-    workers = int(os.getenv("WORKERS", "4"))
+    # Each worker runs its own lifespan: Redis state is shared, in-memory caches are not
+    workers = int(os.getenv("WORKERS", str(os.cpu_count() or 1)))
     
     if os.getenv("ENV") == "production":
         # Production with Gunicorn
@@ -781,7 +934,7 @@ def main():
                 return self.application
         
         options = {
-            "bind": f"{host}:{port}",
+            "bind": f"{HOST}:{PORT}",
             "workers": workers,
             "worker_class": "uvicorn.workers.UvicornWorker",
             "accesslog": "-",
@@ -795,8 +948,8 @@ def main():
         # Development with Uvicorn
         uvicorn.run(
             "augments_mcp.web_server:app",
-            host=host,
-            port=port,
+            host=HOST,
+            port=PORT,
             reload=True,
             log_level="info"
         )
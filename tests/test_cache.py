@@ -98,4 +98,25 @@ async def test_framework_cache_info(temp_cache_dir):
     info = await cache.get_framework_cache_info("test_framework")
     assert "memory_entries" in info  # The actual key name
     assert "disk_entries" in info     # The actual key name
-    assert info["memory_entries"] >= 2
\ No newline at end of file
+    assert info["memory_entries"] >= 2
+
+@pytest.mark.asyncio
+async def test_cache_get_many(temp_cache_dir):
+    """Test batched lookups across memory and disk."""
+    cache = DocumentationCache(cache_dir=temp_cache_dir)
+    
+    await cache.set("test_framework", "content 1", path="section1")
+    await cache.set("test_framework", "content 2", path="section2")
+    
+    # Force the second section to come from disk
+    cache.memory_cache.clear()
+    await cache.get("test_framework", path="section1")
+    
+    results = await cache.get_many("test_framework", ["section1", "section2", "missing"])
+    assert results == {"section1": "content 1", "section2": "content 2"}
+    
+    # A corrupt disk entry only drops its own key
+    cache.memory_cache.clear()
+    cache.cache.set(cache._get_cache_key("test_framework", "section1", "docs"), {"bogus": True})
+    results = await cache.get_many("test_framework", ["section1", "section2"])
+    assert results == {"section2": "content 2"}
@@ -3,6 +3,7 @@
 import pytest
 import pytest_asyncio
 import os
+import json
 import tempfile
 from src.augments_mcp.registry.manager import FrameworkRegistryManager
 from src.augments_mcp.registry.cache import DocumentationCache
@@ -154,4 +155,50 @@ async def test_framework_categories(temp_frameworks_dir):
     assert isinstance(categories, list)
     
     # Cleanup
-    await manager.shutdown()
\ No newline at end of file
+    await manager.shutdown()
+
+@pytest.mark.asyncio
+async def test_registry_revision_tracks_reloads(temp_frameworks_dir):
+    """Test that the registry revision changes when configs are reloaded."""
+    manager = FrameworkRegistryManager(temp_frameworks_dir)
+    await manager.initialize()
+    
+    revision = manager.revision
+    assert revision > 0
+    
+    # Reloading a config must invalidate derived caches
+    await manager.reload_framework_config(
+        os.path.join(temp_frameworks_dir, "tools", "test-framework.json")
+    )
+    assert manager.revision > revision
+    
+    # Cleanup
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_list_frameworks_cache_invalidation(temp_frameworks_dir):
+    """Test that memoized listings are rebuilt after a config hot-reload."""
+    manager = FrameworkRegistryManager(temp_frameworks_dir)
+    await manager.initialize()
+    
+    first = manager.list_frameworks(category="tools")
+    assert first[0].priority == 50
+    
+    # Callers may mutate the returned list without affecting the memo
+    first.clear()
+    assert len(manager.list_frameworks(category="tools")) == 1
+    
+    # Rewrite the config on disk and reload it like the file watcher does
+    config_path = os.path.join(temp_frameworks_dir, "tools", "test-framework.json")
+    with open(config_path) as f:
+        config = json.load(f)
+    config["priority"] = 99
+    with open(config_path, "w") as f:
+        json.dump(config, f)
+    
+    await manager.reload_framework_config(config_path)
+    assert manager.list_frameworks(category="tools")[0].priority == 99
+    
+    # Cleanup
+    await manager.shutdown()
@@ -1,7 +1,11 @@
 """Tests for MCP tools functionality."""
 
+import asyncio
+import multiprocessing
+import pickle
 import pytest
-from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import AsyncMock, Mock
 from src.augments_mcp.tools.framework_discovery import (
     list_available_frameworks,
     search_frameworks,
@@ -9,6 +13,16 @@ from src.augments_mcp.tools.framework_discovery import (
     validate_framework_exists,
     get_registry_stats
 )
+from src.augments_mcp.tools.context_enhancement import (
+    analyze_code_compatibility,
+    analyze_code_compatibility_sync
+)
+from src.augments_mcp.tools import updates
+from src.augments_mcp.registry.models import (
+    FrameworkConfig,
+    FrameworkSources,
+    DocumentationSource
+)
 
 
 @pytest.fixture
@@ -101,4 +115,82 @@ async def test_get_registry_stats(mock_registry_manager):
     assert "total_frameworks" in result
     assert "categories" in result
     assert result["total_frameworks"] == 1
-    assert "test" in result["categories"]
\ No newline at end of file
+    assert "test" in result["categories"]
+
+def test_analyze_code_compatibility_sync():
+    """Test the registry-free compatibility analysis."""
+    react_config = Mock()
+    react_config.name = "react"
+    
+    result = analyze_code_compatibility_sync(
+        "const App = () => <Header />",
+        {"react": react_config}
+    )
+    
+    assert result["frameworks"] == ["react"]
+    assert result["compatible"] is False
+    assert any("React not imported" in issue["message"] for issue in result["issues"])
+
+
+@pytest.mark.asyncio
+async def test_analyze_code_compatibility_in_process_pool():
+    """Test that the analysis runs in a worker process with real configs."""
+    react_config = FrameworkConfig(
+        name="react",
+        display_name="React",
+        category="web",
+        type="library",
+        sources=FrameworkSources(
+            documentation=DocumentationSource(website="https://react.dev")
+        ),
+        context_files=["README.md"],
+        key_features=["components", "hooks"],
+        common_patterns=["hooks"]
+    )
+    assert pickle.loads(pickle.dumps(react_config)) == react_config
+    
+    registry = Mock()
+    registry.get_framework.return_value = react_config
+    
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        result = await analyze_code_compatibility(
+            registry, "const App = () => <Header />", ["react"], executor=executor
+        )
+    
+    assert result["frameworks"] == ["react"]
+    assert any("React not imported" in issue["message"] for issue in result["issues"])
+
+
+@pytest.mark.asyncio
+async def test_refresh_framework_cache_concurrent(monkeypatch):
+    """Test that refreshes run bounded, and failures and progress errors stay isolated."""
+    running = 0
+    max_running = 0
+    
+    async def fake_refresh(registry, cache, github, website, fw_name, force):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if fw_name == "broken":
+            raise RuntimeError("fetch failed")
+        return {"framework": fw_name, "refreshed": True}
+    
+    monkeypatch.setattr(updates, "REFRESH_CONCURRENCY", 2)
+    monkeypatch.setattr(updates, "_refresh_single_framework", fake_refresh)
+    
+    registry = Mock()
+    registry.frameworks = {name: Mock() for name in ["a", "b", "broken", "c", "d", "e"]}
+    ctx = AsyncMock()
+    ctx.report_progress.side_effect = RuntimeError("client went away")
+    
+    summary = await updates.refresh_framework_cache(
+        registry, Mock(), Mock(), Mock(), ctx=ctx
+    )
+    
+    assert "Refreshed: 5 frameworks" in summary
+    assert "Failed: 1 frameworks (broken)" in summary
+    assert max_running == 2
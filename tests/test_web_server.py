@@ -0,0 +1,181 @@
+"""Tests for the FastAPI web server request handling."""
+
+import pytest
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from src.augments_mcp import web_server
+from src.augments_mcp.registry.models import FrameworkInfo
+from src.augments_mcp.web_server import app, json_body_docs, MAX_REQUEST_BODY_BYTES
+
+
+@pytest.fixture
+def client():
+    """Test client without the lifespan, so no Redis or registry is needed."""
+    return TestClient(app, base_url="http://localhost")
+
+
+def test_analyze_rejects_oversized_body(client):
+    """Test that bodies over the limit are rejected with 413."""
+    response = client.post(
+        "/api/v1/analyze",
+        content=b"x" * (MAX_REQUEST_BODY_BYTES + 1),
+        headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 413
+    assert "exceeds limit" in response.json()["error"]
+
+
+def test_analyze_rejects_oversized_chunked_body(client):
+    """Test that chunked bodies without Content-Length are also limited."""
+    def chunks():
+        for _ in range(MAX_REQUEST_BODY_BYTES // 4096 + 2):
+            yield b"x" * 4096
+
+    response = client.post("/api/v1/analyze", content=chunks())
+
+    assert response.status_code == 413
+
+
+def test_analyze_invalid_json_returns_422(client):
+    """Test that malformed JSON is reported as a body validation error."""
+    response = client.post(
+        "/api/v1/analyze",
+        content=b"{bad",
+        headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert errors[0]["type"] == "json_invalid"
+    assert errors[0]["loc"] == ["body"]
+
+
+def test_analyze_wrong_types_returns_422(client):
+    """Test that field errors are located under the request body."""
+    response = client.post("/api/v1/analyze", json={"code": 1, "frameworks": "react"})
+
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert ["body", "code"] in locs
+    assert ["body", "frameworks"] in locs
+
+
+def test_json_body_docs_rejects_nested_models():
+    """Test that nested models are refused instead of emitting dangling refs."""
+    class Inner(BaseModel):
+        value: int
+
+    class Outer(BaseModel):
+        inner: Inner
+
+    with pytest.raises(ValueError):
+        json_body_docs(Outer)
+
+
+def test_openapi_includes_analyze_request_body(client):
+    """Test that the analyze endpoint documents its request body."""
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/api/v1/analyze"]["post"]["requestBody"]
+
+    assert body["required"] is True
+    assert "code" in body["content"]["application/json"]["schema"]["properties"]
+
+
+class BrokenExecutor(Executor):
+    """Executor that behaves like a pool whose worker died."""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_analyze_replaces_broken_process_pool(client, monkeypatch):
+    """Test that a dead worker does not leave the analysis endpoint broken."""
+    react_config = Mock()
+    react_config.name = "react"
+    registry = Mock()
+    registry.get_framework.return_value = react_config
+
+    broken = BrokenExecutor()
+    replacement = Mock()
+    monkeypatch.setattr(web_server, "create_cpu_pool", lambda: replacement)
+    monkeypatch.setattr(app.state, "registry_manager", registry, raising=False)
+    monkeypatch.setattr(app.state, "cpu_pool", broken, raising=False)
+
+    response = client.post(
+        "/api/v1/analyze",
+        json={"code": "const App = () => <Header />", "frameworks": ["react"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["frameworks"] == ["react"]
+    assert broken.shut_down
+    assert app.state.cpu_pool is replacement
+
+
+class FakeRegistry:
+    """Registry stand-in whose listing and revision tests can change."""
+
+    def __init__(self, priority=50):
+        self.revision = 0
+        self.priority = priority
+
+    def list_frameworks(self, category=None):
+        return [
+            FrameworkInfo(
+                name="test-framework",
+                display_name="Test Framework",
+                category="tools",
+                type="library",
+                version="1.0.0",
+                description="A test framework",
+                tags=["test"],
+                priority=self.priority
+            )
+        ]
+
+
+def test_list_frameworks_catalog_matches_category_path(client, monkeypatch):
+    """Test that the pre-encoded catalog has the same shape as SuccessResponse."""
+    monkeypatch.setattr(app.state, "registry_manager", FakeRegistry(), raising=False)
+    monkeypatch.setattr(app.state, "catalog_cache", None, raising=False)
+
+    full = client.get("/api/v1/frameworks").json()
+    filtered = client.get("/api/v1/frameworks", params={"category": "tools"}).json()
+
+    assert full.keys() == filtered.keys()
+    assert full["success"] is True
+    assert full["data"] == filtered["data"]
+    assert full["request_id"]
+
+
+def test_list_frameworks_catalog_rebuilds(client, monkeypatch):
+    """Test that the catalog follows registry reloads and registry replacement."""
+    registry = FakeRegistry(priority=50)
+    monkeypatch.setattr(app.state, "registry_manager", registry, raising=False)
+    monkeypatch.setattr(app.state, "catalog_cache", None, raising=False)
+
+    def priority():
+        return client.get("/api/v1/frameworks").json()["data"]["frameworks"][0]["priority"]
+
+    assert priority() == 50
+
+    # A config reload bumps the revision
+    registry.priority = 60
+    registry.revision += 1
+    assert priority() == 60
+
+    # A new registry can reach the same revision number but must not reuse the old body
+    new_registry = FakeRegistry(priority=70)
+    new_registry.revision = registry.revision
+    monkeypatch.setattr(app.state, "registry_manager", new_registry)
+    assert priority() == 70